@@ -0,0 +1,123 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from starlette.responses import JSONResponse
+
+from core.config import settings
+
+class TokenBucket:
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: int, now: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+
+    def take(self, now: float) -> float:
+        """Consume one token; return 0 on success or the seconds until one is available."""
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+class ClientLimiter:
+    """Token buckets per client and route class, evicting the least recently seen client."""
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]], max_clients: int):
+        self.limits = limits
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[str, Dict[str, TokenBucket]]" = OrderedDict()
+
+    def check(self, client: str, route_class: str) -> float:
+        now = time.monotonic()
+        buckets = self._clients.get(client)
+        if buckets is None:
+            buckets = self._clients[client] = {}
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client)
+        bucket = buckets.get(route_class)
+        if bucket is None:
+            rate, burst = self.limits[route_class]
+            bucket = buckets[route_class] = TokenBucket(rate, burst, now)
+        return bucket.take(now)
+
+def classify(method: str, path: str) -> str:
+    if path.startswith(f"{settings.API_V1_STR}/auth"):
+        return "auth"
+    if method in ("GET", "HEAD"):
+        return "read"
+    return "write"
+
+def worker_share(total: int, workers: int) -> int:
+    """Split a server-wide cap between workers, rounding down but keeping one slot each."""
+    return max(1, total // workers)
+
+class AdmissionControlMiddleware:
+    """Rate limits each client per route class and caps in-flight requests per class.
+
+    A request that cannot start within ADMISSION_QUEUE_BUDGET_MS is shed with a
+    503 rather than left to queue behind the SQLite writer or bcrypt.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.limiter = ClientLimiter(
+            {
+                "auth": (settings.RATE_LIMIT_AUTH_PER_SECOND, settings.RATE_LIMIT_AUTH_BURST),
+                "read": (settings.RATE_LIMIT_READ_PER_SECOND, settings.RATE_LIMIT_READ_BURST),
+                "write": (settings.RATE_LIMIT_WRITE_PER_SECOND, settings.RATE_LIMIT_WRITE_BURST),
+            },
+            settings.RATE_LIMIT_MAX_CLIENTS,
+        )
+        workers = max(1, settings.WORKER_COUNT)
+        self.slots = {
+            "auth": asyncio.Semaphore(worker_share(settings.MAX_INFLIGHT_AUTH, workers)),
+            "read": asyncio.Semaphore(worker_share(settings.MAX_INFLIGHT_READ, workers)),
+            "write": asyncio.Semaphore(worker_share(settings.MAX_INFLIGHT_WRITE, workers)),
+        }
+        self.queue_budget = settings.ADMISSION_QUEUE_BUDGET_MS / 1000
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or not settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        route_class = classify(scope["method"], scope["path"])
+        client = scope["client"][0] if scope.get("client") else "unknown"
+        retry_after = self.limiter.check(client, route_class)
+        if retry_after:
+            response = JSONResponse(
+                {"detail": "Too many requests"},
+                status_code=429,
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        slots = self.slots[route_class]
+        try:
+            if slots.locked():
+                await asyncio.wait_for(slots.acquire(), timeout=self.queue_budget)
+            else:
+                # A free slot never blocks, so skip the task wait_for would create
+                await slots.acquire()
+        except asyncio.TimeoutError:
+            response = JSONResponse(
+                {"detail": "Server busy, try again shortly"},
+                status_code=503,
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            slots.release()
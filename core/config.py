@@ -8,6 +8,37 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     DATABASE_URL: str
+    SQL_ECHO: bool = True
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    FACET_RECONCILE_SECONDS: int = 300
+    BATCH_MAX_IDS: int = 100
+
+    # Admission control: token buckets per client and route class (auth, read, write).
+    # Buckets are per worker; a client whose connections spread over N serve.py workers
+    # can reach up to N times these rates.
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_MAX_CLIENTS: int = 10000
+    RATE_LIMIT_AUTH_PER_SECOND: float = 0.2
+    RATE_LIMIT_AUTH_BURST: int = 5
+    RATE_LIMIT_READ_PER_SECOND: float = 20.0
+    RATE_LIMIT_READ_BURST: int = 40
+    RATE_LIMIT_WRITE_PER_SECOND: float = 5.0
+    RATE_LIMIT_WRITE_BURST: int = 10
+    # In-flight caps are totals across serve.py workers. Each worker gets total // workers,
+    # but never less than one, so with more workers than the cap the total becomes the worker count.
+    MAX_INFLIGHT_AUTH: int = 4
+    MAX_INFLIGHT_READ: int = 64
+    MAX_INFLIGHT_WRITE: int = 8
+    ADMISSION_QUEUE_BUDGET_MS: int = 250
+
+    # Multi-worker serving (serve.py)
+    SERVE_HOST: str = "0.0.0.0"
+    SERVE_PORT: int = 8001
+    SERVE_WORKERS: int = 0  # 0 means one per CPU
+    WORKER_COUNT: int = 1  # set by serve.py for its workers
+    SERVE_GRACEFUL_TIMEOUT: int = 30
+    INVALIDATION_POLL_MS: int = 500
+    INVALIDATION_RETENTION_SECONDS: int = 3600
 
     class Config:
         env_file = ".env"
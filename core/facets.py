@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import settings
+from core.invalidation import invalidation_bus
+from models.material import Material
+
+logger = logging.getLogger(__name__)
+
+FACET_FIELDS = ("category", "location", "unit")
+
+FacetKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+def is_listed(material: Material) -> bool:
+    return material.availability_status == "available" and not material.is_blocked
+
+class FacetIndex:
+    """In-memory counts of listed materials per category, location and unit.
+
+    Each material's current facet key is remembered so that a change only
+    touches the counters it moves between, and reads never scan rows.
+    """
+
+    def __init__(self):
+        self._keys: Dict[int, FacetKey] = {}
+        self._counts: Dict[str, Counter] = {field: Counter() for field in FACET_FIELDS}
+        # Latest key of every material changed while a reconcile is reading the database
+        self._dirty: Optional[Dict[int, Optional[FacetKey]]] = None
+
+    def _add(self, key: FacetKey):
+        for field, value in zip(FACET_FIELDS, key):
+            if value is not None:
+                self._counts[field][value] += 1
+
+    def _remove(self, key: FacetKey):
+        for field, value in zip(FACET_FIELDS, key):
+            if value is None:
+                continue
+            counter = self._counts[field]
+            counter[value] -= 1
+            if counter[value] <= 0:
+                del counter[value]
+
+    def _set(self, material_id: int, key: Optional[FacetKey]):
+        if self._dirty is not None:
+            self._dirty[material_id] = key
+        old = self._keys.get(material_id)
+        if old == key:
+            return
+        if old is not None:
+            self._remove(old)
+            del self._keys[material_id]
+        if key is not None:
+            self._add(key)
+            self._keys[material_id] = key
+
+    def apply(self, material: Material):
+        """Record the current state of a material after it was written."""
+        key = (material.category, material.location, material.unit) if is_listed(material) else None
+        self._set(material.material_id, key)
+
+    def discard(self, material_id: int):
+        self._set(material_id, None)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {field: dict(counter.most_common()) for field, counter in self._counts.items()}
+
+    async def refresh(self, db: AsyncSession, key: str):
+        """Re-read one material after another worker changed it."""
+        material = await db.get(Material, int(key), populate_existing=True)
+        if material is None:
+            self.discard(int(key))
+        else:
+            self.apply(material)
+
+    async def reconcile(self, db: AsyncSession):
+        """Rebuild the counts from the database, correcting any drift.
+
+        Changes applied while the query is in flight may be newer than what it
+        read, so they are replayed on top of the rebuilt state.
+        """
+        self._dirty = {}
+        try:
+            result = await db.execute(
+                select(Material.material_id, Material.category, Material.location, Material.unit).where(
+                    Material.availability_status == "available",
+                    Material.is_blocked == False
+                )
+            )
+            keys = {row.material_id: (row.category, row.location, row.unit) for row in result}
+            for material_id, key in self._dirty.items():
+                if key is None:
+                    keys.pop(material_id, None)
+                else:
+                    keys[material_id] = key
+        finally:
+            self._dirty = None
+        counts = {field: Counter() for field in FACET_FIELDS}
+        for key in keys.values():
+            for field, value in zip(FACET_FIELDS, key):
+                if value is not None:
+                    counts[field][value] += 1
+        self._keys = keys
+        self._counts = counts
+
+facet_index = FacetIndex()
+invalidation_bus.subscribe("material", facet_index.refresh)
+
+async def reconcile_periodically(session_factory):
+    while True:
+        await asyncio.sleep(settings.FACET_RECONCILE_SECONDS)
+        try:
+            async with session_factory() as db:
+                await facet_index.reconcile(db)
+        except Exception:
+            logger.exception("Facet reconciliation failed")
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+import os
+import socket
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from core.config import settings
+from models.invalidation import CacheInvalidation
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[AsyncSession, str], Awaitable[None]]
+
+class InvalidationBus:
+    """Cross-worker cache invalidation over a change-log table.
+
+    Writers add an event to the session of the write itself, so it commits
+    atomically with the data. Every worker polls for events newer than the
+    last one it saw and runs the handlers subscribed to their topic; events a
+    worker published itself are skipped since it already updated its caches.
+    """
+
+    def __init__(self):
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+        self._last_id = 0
+
+    def subscribe(self, topic: str, handler: Handler):
+        self._handlers[topic].append(handler)
+
+    def publish(self, db: AsyncSession, topic: str, key):
+        db.add(CacheInvalidation(topic=topic, key=str(key), origin=self.origin))
+
+    async def start(self, session_factory):
+        # Workers are forked/spawned from the same parent, so re-derive the origin per process
+        self.origin = f"{socket.gethostname()}:{os.getpid()}"
+        async with session_factory() as db:
+            self._last_id = await self._max_id(db)
+
+    async def _max_id(self, db: AsyncSession) -> int:
+        result = await db.execute(select(func.max(CacheInvalidation.event_id)))
+        return result.scalar() or 0
+
+    async def poll(self, db: AsyncSession):
+        result = await db.execute(
+            select(CacheInvalidation)
+            .where(CacheInvalidation.event_id > self._last_id)
+            .order_by(CacheInvalidation.event_id)
+        )
+        events = result.scalars().all()
+        if not events:
+            # A table created without AUTOINCREMENT restarts its ids once pruning empties it;
+            # every row left is then newer than anything seen, so read it from the start
+            if await self._max_id(db) < self._last_id:
+                self._last_id = 0
+            return
+        for event in events:
+            if event.origin != self.origin:
+                for handler in self._handlers.get(event.topic, []):
+                    await handler(db, event.key)
+            self._last_id = event.event_id
+
+    async def prune(self, db: AsyncSession):
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.INVALIDATION_RETENTION_SECONDS)
+        await db.execute(delete(CacheInvalidation).where(CacheInvalidation.created_at < cutoff))
+        await db.commit()
+
+    async def run(self, session_factory):
+        interval = settings.INVALIDATION_POLL_MS / 1000
+        polls_per_prune = max(1, int(settings.INVALIDATION_RETENTION_SECONDS / interval))
+        polls = 0
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with session_factory() as db:
+                    await self.poll(db)
+                    polls += 1
+                    if polls % polls_per_prune == 0:
+                        await self.prune(db)
+            except Exception:
+                logger.exception("Cache invalidation poll failed")
+
+invalidation_bus = InvalidationBus()
+
+async def create_table(engine: AsyncEngine):
+    """Create the change-log table if missing; safe to run from several workers at once."""
+    async with engine.begin() as conn:
+        await conn.execute(CreateTable(CacheInvalidation.__table__, if_not_exists=True))
+        for index in CacheInvalidation.__table__.indexes:
+            await conn.execute(CreateIndex(index, if_not_exists=True))
@@ -1,10 +1,21 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+engine = create_async_engine(settings.DATABASE_URL, echo=settings.SQL_ECHO)
 async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def configure_sqlite(dbapi_connection, connection_record):
+        # WAL lets readers (and the invalidation poll) run alongside the single writer, and the
+        # busy timeout makes writers from other worker processes wait instead of failing
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
+
 async def get_session() -> AsyncSession:
     async with async_session() as session:
         yield session
\ No newline at end of file
@@ -0,0 +1,106 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Set
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.connection import get_session
+from models.buyer import Buyer
+from models.material import Material, MaterialPhoto
+from models.request import Request
+
+BatchFn = Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]
+
+class DataLoader:
+    """Coalesces every load() made within one event-loop tick into one batch call.
+
+    Results are memoised per key, so a loader should live no longer than the
+    request that created it.
+    """
+
+    def __init__(self, batch_fn: BatchFn, lock: asyncio.Lock, default_factory: Callable[[], Any] = lambda: None):
+        self._batch_fn = batch_fn
+        self._lock = lock
+        self._default_factory = default_factory
+        self._cache: Dict[Hashable, asyncio.Future] = {}
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        # The event loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    def load(self, key: Hashable) -> asyncio.Future:
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        if not self._pending:
+            loop.call_soon(self._schedule_dispatch)
+        self._pending[key] = future
+        return future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _schedule_dispatch(self):
+        task = asyncio.ensure_future(self._dispatch())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self):
+        batch, self._pending = self._pending, {}
+        try:
+            # The session is shared by every loader of a request and cannot run queries concurrently
+            async with self._lock:
+                results = await self._batch_fn(list(batch))
+        except BaseException as exc:
+            for key, future in batch.items():
+                self._cache.pop(key, None)
+                if future.done():
+                    continue
+                if isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+            # Ordinary errors are delivered through the futures; cancellation must propagate
+            if not isinstance(exc, Exception):
+                raise
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results[key] if key in results else self._default_factory())
+
+class Loaders:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        lock = asyncio.Lock()
+        self.materials = DataLoader(self._load_materials, lock)
+        self.photos = DataLoader(self._load_photos, lock, default_factory=list)
+        self.buyers = DataLoader(self._load_buyers, lock)
+        self.requests = DataLoader(self._load_requests, lock)
+
+    async def _load_materials(self, ids: List[int]) -> Dict[int, Material]:
+        result = await self.db.execute(select(Material).where(Material.material_id.in_(ids)))
+        return {m.material_id: m for m in result.scalars().all()}
+
+    async def _load_photos(self, material_ids: List[int]) -> Dict[int, List[str]]:
+        result = await self.db.execute(
+            select(MaterialPhoto.material_id, MaterialPhoto.photo_url).where(MaterialPhoto.material_id.in_(material_ids))
+        )
+        photos = defaultdict(list)
+        for material_id, photo_url in result:
+            photos[material_id].append(photo_url)
+        return photos
+
+    async def _load_buyers(self, ids: List[int]) -> Dict[int, Buyer]:
+        result = await self.db.execute(select(Buyer).where(Buyer.buyer_id.in_(ids)))
+        return {b.buyer_id: b for b in result.scalars().all()}
+
+    async def _load_requests(self, ids: List[int]) -> Dict[int, Request]:
+        result = await self.db.execute(select(Request).where(Request.request_id.in_(ids)))
+        return {r.request_id: r for r in result.scalars().all()}
+
+async def get_loaders(db: AsyncSession = Depends(get_session)) -> Loaders:
+    return Loaders(db)
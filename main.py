@@ -2,13 +2,48 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from core.config import settings
-from routes import auth, material, request, map, admin, feedback, report, analytics
+from core.admission import AdmissionControlMiddleware
+from sqlalchemy import select
+from core.facets import facet_index, reconcile_periodically
+from core.invalidation import create_table, invalidation_bus
+from db.connection import async_session, engine
+from models.material import Material, MaterialPhoto
+from routes import auth, material, buyer, request, map, admin, feedback, report, analytics
+
+async def warm_up():
+    # Open the pool and compile the hot queries before this worker accepts traffic
+    async with async_session() as db:
+        await facet_index.reconcile(db)
+        await db.execute(select(Material).where(Material.material_id == 0))
+        await db.execute(select(MaterialPhoto.photo_url).where(MaterialPhoto.material_id == 0))
+        await db.execute(select(Material).where(Material.material_id.in_([0])))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Idempotent, so every worker can run it whichever way the app is hosted
+    await create_table(engine)
+    # Record the starting event before warm-up reads the facets, so writes in between are replayed
+    await invalidation_bus.start(async_session)
+    await warm_up()
+    # Facet counts are kept incrementally; reconciling periodically corrects any drift
+    tasks = [
+        asyncio.create_task(reconcile_periodically(async_session)),
+        asyncio.create_task(invalidation_bus.run(async_session)),
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
 
 def create_application() -> FastAPI:
-    app = FastAPI(title=settings.PROJECT_NAME)
+    app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
+    
+    # Admission control (added before CORS so rejections still carry CORS headers)
+    app.add_middleware(AdmissionControlMiddleware)
     
     # CORS
     app.add_middleware(
@@ -22,6 +57,7 @@ def create_application() -> FastAPI:
     # Register Routers
     app.include_router(auth.router, prefix=f'{settings.API_V1_STR}/auth', tags=['auth'])
     app.include_router(material.router, prefix=f'{settings.API_V1_STR}/materials', tags=['materials'])
+    app.include_router(buyer.router, prefix=f'{settings.API_V1_STR}/buyers', tags=['buyers'])
     app.include_router(request.router, prefix=f'{settings.API_V1_STR}/interactions', tags=['interactions'])
     app.include_router(map.router, prefix=f'{settings.API_V1_STR}/map', tags=['map'])
     app.include_router(admin.router, prefix=f'{settings.API_V1_STR}/admin', tags=['admin'])
@@ -3,4 +3,5 @@ from models.material import Material, MaterialPhoto
 from models.organization import Organization
 from models.buyer import Buyer
 from models.admin import Admin
-from models.request import Request, RequestFeedback
\ No newline at end of file
+from models.request import Request, RequestFeedback
+from models.invalidation import CacheInvalidation
\ No newline at end of file
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from models.base import Base
+
+class CacheInvalidation(Base):
+    __tablename__ = "cache_invalidation"
+    # Pruning can empty the table; ids must never be reused or workers would skip new events
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    event_id = Column(Integer, primary_key=True, index=True)
+    topic = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    origin = Column(String, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from . import auth
 from . import material
+from . import buyer
 from . import request
 from . import map
 from . import admin
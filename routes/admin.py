@@ -1,7 +1,35 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from db.connection import get_session
+from models.material import Material
+from core.facets import facet_index
+from core.invalidation import invalidation_bus
+from routes.auth import TokenData, get_current_user
 
 router = APIRouter()
 
 @router.get("/")
 async def get_admin():
-    return {"message": "Admin endpoint"}
\ No newline at end of file
+    return {"message": "Admin endpoint"}
+
+@router.put("/materials/{material_id}/block")
+async def set_material_blocked(
+    material_id: int,
+    is_blocked: bool = True,
+    current_user: TokenData = Depends(get_current_user),
+    db: AsyncSession = Depends(get_session)
+):
+    if current_user.type != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
+
+    result = await db.execute(select(Material).where(Material.material_id == material_id))
+    material = result.scalar_one_or_none()
+    if not material:
+        raise HTTPException(status_code=404, detail="Material not found")
+
+    material.is_blocked = is_blocked
+    invalidation_bus.publish(db, "material", material.material_id)
+    await db.commit()
+    facet_index.apply(material)
+    return {"message": "Material blocked" if is_blocked else "Material unblocked"}
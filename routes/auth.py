@@ -23,6 +23,7 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     email: str | None = None
+    type: str | None = None
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -72,7 +73,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
-        token_data = TokenData(email=email)
+        token_data = TokenData(email=email, type=payload.get("type"))
     except JWTError:
         raise credentials_exception
     return token_data
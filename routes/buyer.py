@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from typing import List, Optional
+from core.config import settings
+from db.loader import Loaders, get_loaders
+
+router = APIRouter()
+
+class BuyerSummary(BaseModel):
+    buyer_id: int
+    name: str
+    organization: Optional[str] = None
+
+# Buyer contact details stay private; these endpoints only expose what a listing shows
+@router.get("/batch", response_model=List[BuyerSummary])
+async def get_buyers_batch(ids: List[int] = Query(..., max_length=settings.BATCH_MAX_IDS), loaders: Loaders = Depends(get_loaders)):
+    ids = list(dict.fromkeys(ids))
+    buyers = await loaders.buyers.load_many(ids)
+    return [
+        BuyerSummary(
+            buyer_id=b.buyer_id,
+            name=b.name,
+            organization=b.organization
+        ) for b in buyers if b is not None
+    ]
+
+@router.get("/{buyer_id}", response_model=BuyerSummary)
+async def get_buyer(buyer_id: int, loaders: Loaders = Depends(get_loaders)):
+    buyer = await loaders.buyers.load(buyer_id)
+    if not buyer:
+        raise HTTPException(status_code=404, detail="Buyer not found")
+
+    return BuyerSummary(
+        buyer_id=buyer.buyer_id,
+        name=buyer.name,
+        organization=buyer.organization
+    )
@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from db.connection import get_session
+from core.config import settings
+from db.loader import Loaders, get_loaders
+from core.facets import facet_index
+from core.invalidation import invalidation_bus
 from models.material import Material, MaterialPhoto
 from models.organization import Organization
 
@@ -31,14 +35,39 @@ class MaterialResponse(BaseModel):
     is_blocked: bool
     photos: List[str] = []
 
+class MaterialSummary(BaseModel):
+    material_id: int
+    title: str
+    category: str
+    quantity: Optional[float] = None
+    unit: Optional[str] = None
+    availability_status: str
+
+class FacetsResponse(BaseModel):
+    category: Dict[str, int]
+    location: Dict[str, int]
+    unit: Dict[str, int]
+
 @router.get("/", response_model=List[MaterialResponse])
-async def get_materials(limit: int = 10, offset: int = 0, db: AsyncSession = Depends(get_session)):
-    result = await db.execute(
-        select(Material).where(
-            Material.availability_status == "available",
-            Material.is_blocked == False
-        ).limit(limit).offset(offset)
+async def get_materials(
+    limit: int = 10,
+    offset: int = 0,
+    category: Optional[str] = None,
+    location: Optional[str] = None,
+    unit: Optional[str] = None,
+    db: AsyncSession = Depends(get_session)
+):
+    query = select(Material).where(
+        Material.availability_status == "available",
+        Material.is_blocked == False
     )
+    if category is not None:
+        query = query.where(Material.category == category)
+    if location is not None:
+        query = query.where(Material.location == location)
+    if unit is not None:
+        query = query.where(Material.unit == unit)
+    result = await db.execute(query.limit(limit).offset(offset))
     materials = result.scalars().all()
     
     response = []
@@ -60,6 +89,31 @@ async def get_materials(limit: int = 10, offset: int = 0, db: AsyncSession = Dep
         ))
     return response
 
+@router.get("/facets", response_model=FacetsResponse)
+async def get_material_facets():
+    return FacetsResponse(**facet_index.snapshot())
+
+@router.get("/batch", response_model=List[MaterialResponse])
+async def get_materials_batch(ids: List[int] = Query(..., max_length=settings.BATCH_MAX_IDS), loaders: Loaders = Depends(get_loaders)):
+    ids = list(dict.fromkeys(ids))
+    materials = await loaders.materials.load_many(ids)
+    photos = await loaders.photos.load_many(ids)
+    return [
+        MaterialResponse(
+            material_id=material.material_id,
+            org_id=material.org_id,
+            title=material.title,
+            category=material.category,
+            description=material.description,
+            quantity=material.quantity,
+            unit=material.unit,
+            location=material.location,
+            availability_status=material.availability_status,
+            is_blocked=material.is_blocked,
+            photos=list(photo_urls)
+        ) for material, photo_urls in zip(materials, photos) if material is not None
+    ]
+
 @router.get("/{material_id}", response_model=MaterialResponse)
 async def get_material(material_id: int, db: AsyncSession = Depends(get_session)):
     result = await db.execute(select(Material).where(Material.material_id == material_id))
@@ -102,14 +156,17 @@ async def create_material(material: MaterialCreate, org_id: int, db: AsyncSessio
         location=material.location
     )
     db.add(db_material)
-    await db.commit()
+    # Flush for the id and column defaults; the material, its photos and the invalidation event commit together
+    await db.flush()
     await db.refresh(db_material)
     
     # Add photos
     for url in material.photo_urls:
         db_photo = MaterialPhoto(material_id=db_material.material_id, photo_url=url)
         db.add(db_photo)
+    invalidation_bus.publish(db, "material", db_material.material_id)
     await db.commit()
+    facet_index.apply(db_material)
     
     return MaterialResponse(
         material_id=db_material.material_id,
@@ -139,7 +196,9 @@ async def update_material(material_id: int, material: MaterialCreate, org_id: in
     db_material.unit = material.unit
     db_material.location = material.location
     
+    invalidation_bus.publish(db, "material", db_material.material_id)
     await db.commit()
+    facet_index.apply(db_material)
     return {"message": "Material updated successfully"}
 
 @router.delete("/{material_id}")
@@ -150,5 +209,7 @@ async def delete_material(material_id: int, org_id: int, db: AsyncSession = Depe
         raise HTTPException(status_code=404, detail="Material not found or not owned by organization")
     
     await db.delete(db_material)
+    invalidation_bus.publish(db, "material", material_id)
     await db.commit()
+    facet_index.discard(material_id)
     return {"message": "Material deleted successfully"}
\ No newline at end of file
@@ -1,14 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 from db.connection import get_session
+from core.config import settings
+from db.loader import Loaders, get_loaders
+from core.facets import facet_index
+from core.invalidation import invalidation_bus
 from models.request import Request, RequestFeedback
 from models.material import Material
 from models.buyer import Buyer
 from models.organization import Organization
+from routes.material import MaterialSummary
+from routes.buyer import BuyerSummary
 
 router = APIRouter()
 
@@ -24,6 +30,38 @@ class RequestResponse(BaseModel):
     status: str
     message: Optional[str] = None
     created_at: datetime
+    material: Optional[MaterialSummary] = None
+    buyer: Optional[BuyerSummary] = None
+
+async def build_request_responses(requests: List[Request], loaders: Loaders, embed: bool = False) -> List[RequestResponse]:
+    materials = [None] * len(requests)
+    buyers = [None] * len(requests)
+    if embed:
+        materials = await loaders.materials.load_many(r.material_id for r in requests)
+        buyers = await loaders.buyers.load_many(r.buyer_id for r in requests)
+    return [
+        RequestResponse(
+            request_id=r.request_id,
+            material_id=r.material_id,
+            buyer_id=r.buyer_id,
+            status=r.status,
+            message=r.message,
+            created_at=r.created_at,
+            material=MaterialSummary(
+                material_id=m.material_id,
+                title=m.title,
+                category=m.category,
+                quantity=m.quantity,
+                unit=m.unit,
+                availability_status=m.availability_status
+            ) if m else None,
+            buyer=BuyerSummary(
+                buyer_id=b.buyer_id,
+                name=b.name,
+                organization=b.organization
+            ) if b else None
+        ) for r, m, b in zip(requests, materials, buyers)
+    ]
 
 @router.post("/materials/{material_id}/request", response_model=RequestResponse)
 async def create_request(material_id: int, request: RequestCreate, db: AsyncSession = Depends(get_session)):
@@ -69,38 +107,26 @@ async def create_request(material_id: int, request: RequestCreate, db: AsyncSess
     )
 
 @router.get("/org/materials/{material_id}/requests", response_model=List[RequestResponse])
-async def get_requests_for_material(material_id: int, db: AsyncSession = Depends(get_session)):
+async def get_requests_for_material(material_id: int, embed: bool = False, db: AsyncSession = Depends(get_session), loaders: Loaders = Depends(get_loaders)):
     result = await db.execute(
         select(Request).where(Request.material_id == material_id).order_by(Request.created_at.desc())
     )
     requests = result.scalars().all()
-    return [
-        RequestResponse(
-            request_id=r.request_id,
-            material_id=r.material_id,
-            buyer_id=r.buyer_id,
-            status=r.status,
-            message=r.message,
-            created_at=r.created_at
-        ) for r in requests
-    ]
+    return await build_request_responses(requests, loaders, embed)
 
 @router.get("/org/requests", response_model=List[RequestResponse])
-async def get_requests_for_organization(org_id: int, db: AsyncSession = Depends(get_session)):
+async def get_requests_for_organization(org_id: int, embed: bool = False, db: AsyncSession = Depends(get_session), loaders: Loaders = Depends(get_loaders)):
     result = await db.execute(
         select(Request).join(Material).where(Material.org_id == org_id).order_by(Request.created_at.desc())
     )
     requests = result.scalars().all()
-    return [
-        RequestResponse(
-            request_id=r.request_id,
-            material_id=r.material_id,
-            buyer_id=r.buyer_id,
-            status=r.status,
-            message=r.message,
-            created_at=r.created_at
-        ) for r in requests
-    ]
+    return await build_request_responses(requests, loaders, embed)
+
+@router.get("/requests/batch", response_model=List[RequestResponse])
+async def get_requests_batch(ids: List[int] = Query(..., max_length=settings.BATCH_MAX_IDS), embed: bool = False, loaders: Loaders = Depends(get_loaders)):
+    ids = list(dict.fromkeys(ids))
+    requests = await loaders.requests.load_many(ids)
+    return await build_request_responses([r for r in requests if r is not None], loaders, embed)
 
 @router.put("/requests/{request_id}/status")
 async def update_request_status(request_id: int, status: str, org_id: int, db: AsyncSession = Depends(get_session)):
@@ -115,10 +141,13 @@ async def update_request_status(request_id: int, status: str, org_id: int, db: A
         raise HTTPException(status_code=404, detail="Request not found")
     
     db_request.status = status
+    material = await db.get(Material, db_request.material_id)
     if status in ["accepted", "rejected"]:
-        db_request.material.availability_status = "requested"
+        material.availability_status = "requested"
     
+    invalidation_bus.publish(db, "material", material.material_id)
     await db.commit()
+    facet_index.apply(material)
     return {"message": "Request status updated successfully"}
 
 @router.post("/materials/{material_id}/mark-transferred")
@@ -129,5 +158,7 @@ async def mark_transferred(material_id: int, db: AsyncSession = Depends(get_sess
         raise HTTPException(status_code=404, detail="Material not found")
     
     material.availability_status = "transferred"
+    invalidation_bus.publish(db, "material", material.material_id)
     await db.commit()
+    facet_index.apply(material)
     return {"message": "Material marked as transferred"}
\ No newline at end of file
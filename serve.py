@@ -0,0 +1,35 @@
+import argparse
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Per-statement SQL logging dominates request cost under load; keep it opt-in for production
+os.environ.setdefault("SQL_ECHO", "false")
+
+import uvicorn
+from core.config import settings
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Upcycle API with multiple worker processes.")
+    parser.add_argument("--host", default=settings.SERVE_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVE_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVE_WORKERS or os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    # Workers inherit the environment, so they can split the in-flight caps between them
+    os.environ["WORKER_COUNT"] = str(args.workers)
+
+    # The supervisor (uvicorn >= 0.30) binds one socket shared by every worker, respawns workers
+    # that die and replaces them one at a time on SIGHUP. Each worker runs the app lifespan
+    # (warm-up, invalidation bus) before it starts accepting connections.
+    uvicorn.run(
+        "main:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=settings.SERVE_GRACEFUL_TIMEOUT,
+    )
+
+if __name__ == "__main__":
+    main()
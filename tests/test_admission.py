@@ -0,0 +1,117 @@
+import asyncio
+
+from core.admission import AdmissionControlMiddleware, ClientLimiter, TokenBucket, classify, worker_share
+from core.config import settings
+
+def test_bucket_allows_burst_then_reports_wait():
+    bucket = TokenBucket(rate=2.0, burst=3, now=0.0)
+
+    assert [bucket.take(0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.take(0.0) == 0.5
+
+def test_bucket_refills_up_to_burst():
+    bucket = TokenBucket(rate=1.0, burst=2, now=0.0)
+    bucket.take(0.0)
+    bucket.take(0.0)
+
+    assert bucket.take(1.0) == 0.0
+    assert bucket.take(1.0) == 1.0
+    # A long idle period does not bank more than the burst
+    assert [bucket.take(100.0) for _ in range(3)] == [0.0, 0.0, 1.0]
+
+def test_limits_are_separate_per_client_and_class():
+    limiter = ClientLimiter({"auth": (1.0, 1), "read": (1.0, 1)}, max_clients=10)
+
+    assert limiter.check("a", "auth") == 0.0
+    assert limiter.check("a", "auth") > 0
+    assert limiter.check("a", "read") == 0.0
+    assert limiter.check("b", "auth") == 0.0
+
+def test_least_recently_seen_client_is_evicted():
+    limiter = ClientLimiter({"auth": (1.0, 1), "read": (1.0, 1)}, max_clients=2)
+    limiter.check("a", "auth")
+    limiter.check("a", "read")
+    limiter.check("b", "auth")
+    limiter.check("a", "auth")
+    limiter.check("c", "auth")
+
+    # Every class a client uses counts once towards max_clients
+    assert list(limiter._clients) == ["a", "c"]
+    assert set(limiter._clients["a"]) == {"auth", "read"}
+
+def test_classify_route_groups():
+    assert classify("POST", f"{settings.API_V1_STR}/auth/login") == "auth"
+    assert classify("GET", f"{settings.API_V1_STR}/materials/") == "read"
+    assert classify("PUT", f"{settings.API_V1_STR}/materials/1") == "write"
+
+class RecordingApp:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if scope["type"] == "http":
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+def make_middleware(app, burst=100, inflight=10, budget_ms=50):
+    middleware = AdmissionControlMiddleware(app)
+    middleware.limiter = ClientLimiter({"auth": (1.0, burst), "read": (1.0, burst), "write": (1.0, burst)}, max_clients=10)
+    middleware.slots = {name: asyncio.Semaphore(inflight) for name in ("auth", "read", "write")}
+    middleware.queue_budget = budget_ms / 1000
+    return middleware
+
+async def call(middleware, method="GET", path="/api/v1/materials/", client="1.2.3.4", scope_type="http"):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": scope_type, "method": method, "path": path, "client": (client, 1234), "headers": []}
+    await middleware(scope, receive, send)
+    start = next((m for m in messages if m["type"] == "http.response.start"), None)
+    if start is None:
+        return None, {}
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}
+
+def test_over_limit_client_gets_429_with_retry_after():
+    async def scenario():
+        middleware = make_middleware(RecordingApp(), burst=2)
+        return [await call(middleware) for _ in range(3)], await call(middleware, client="5.6.7.8")
+
+    results, other_client = asyncio.run(scenario())
+    assert [status for status, _ in results] == [200, 200, 429]
+    assert results[-1][1]["retry-after"] == "1"
+    assert other_client[0] == 200
+
+def test_requests_queued_past_the_budget_are_shed_with_503():
+    async def scenario():
+        middleware = make_middleware(RecordingApp(delay=0.2), inflight=1, budget_ms=50)
+        return await asyncio.gather(*(call(middleware, method="PUT", client=f"c{i}") for i in range(3)))
+
+    statuses = sorted(status for status, _ in asyncio.run(scenario()))
+    assert statuses == [200, 503, 503]
+
+def test_options_and_non_http_scopes_pass_through():
+    async def scenario():
+        app = RecordingApp()
+        middleware = make_middleware(app, burst=1, inflight=1)
+        statuses = [(await call(middleware, method="OPTIONS"))[0] for _ in range(3)]
+        await call(middleware, scope_type="websocket")
+        await call(middleware, scope_type="lifespan")
+        return statuses, app.calls, middleware.limiter._clients
+
+    statuses, calls, clients = asyncio.run(scenario())
+    assert statuses == [200, 200, 200]
+    assert calls == 5
+    assert not clients
+
+def test_worker_share_splits_caps_and_keeps_one_slot():
+    assert worker_share(8, 1) == 8
+    assert worker_share(8, 3) == 2
+    assert worker_share(4, 16) == 1
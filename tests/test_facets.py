@@ -0,0 +1,82 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.facets import FacetIndex
+from models import Base, Material
+
+def make_material(material_id, category="metal", location="pune", unit="kg", status="available", blocked=False):
+    return Material(
+        material_id=material_id,
+        org_id=1,
+        title=f"m{material_id}",
+        category=category,
+        location=location,
+        unit=unit,
+        availability_status=status,
+        is_blocked=blocked,
+    )
+
+def test_apply_counts_listed_materials():
+    index = FacetIndex()
+    index.apply(make_material(1))
+    index.apply(make_material(2, category="elec", location=None))
+
+    assert index.snapshot() == {
+        "category": {"metal": 1, "elec": 1},
+        "location": {"pune": 1},
+        "unit": {"kg": 2},
+    }
+
+def test_apply_moves_counts_on_update():
+    index = FacetIndex()
+    index.apply(make_material(1))
+    index.apply(make_material(1, category="wood"))
+
+    assert index.snapshot()["category"] == {"wood": 1}
+    assert index.snapshot()["unit"] == {"kg": 1}
+
+def test_unlisted_materials_are_removed():
+    index = FacetIndex()
+    index.apply(make_material(1))
+    index.apply(make_material(2))
+    index.apply(make_material(1, blocked=True))
+    index.apply(make_material(2, status="transferred"))
+
+    assert index.snapshot() == {"category": {}, "location": {}, "unit": {}}
+
+def test_discard_is_idempotent():
+    index = FacetIndex()
+    index.apply(make_material(1))
+    index.discard(1)
+    index.discard(1)
+    index.discard(42)
+
+    assert index.snapshot()["category"] == {}
+
+async def _reconcile_with_concurrent_write(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'facets.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        db.add_all([make_material(1), make_material(2, category="elec"), make_material(3, blocked=True)])
+        await db.commit()
+
+    index = FacetIndex()
+    index.apply(make_material(99, category="stale"))
+
+    async def write_during_reconcile():
+        # Runs while reconcile awaits its query, as a request handler would
+        index.apply(make_material(4, category="glass"))
+        index.discard(2)
+
+    async with AsyncSession(engine) as db:
+        await asyncio.gather(index.reconcile(db), write_during_reconcile())
+    await engine.dispose()
+    return index
+
+def test_reconcile_rebuilds_and_keeps_concurrent_changes(tmp_path):
+    index = asyncio.run(_reconcile_with_concurrent_write(tmp_path))
+
+    assert index.snapshot()["category"] == {"metal": 1, "glass": 1}
+    assert index.snapshot()["unit"] == {"kg": 2}
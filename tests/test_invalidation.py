@@ -0,0 +1,38 @@
+import asyncio
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.invalidation import InvalidationBus, create_table
+from models.invalidation import CacheInvalidation
+
+async def _events_after_prune(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bus.db'}")
+    await asyncio.gather(create_table(engine), create_table(engine))
+
+    writer, reader = InvalidationBus(), InvalidationBus()
+    writer.origin = "writer"
+    seen = []
+
+    async def handler(db, key):
+        seen.append(key)
+
+    reader.subscribe("material", handler)
+    async with AsyncSession(engine) as db:
+        await reader.start(lambda: AsyncSession(engine))
+        for key in range(5):
+            writer.publish(db, "material", key)
+        await db.commit()
+        await reader.poll(db)
+
+        # Pruning everything must not make later events look older than the last one seen
+        await db.execute(delete(CacheInvalidation))
+        await db.commit()
+        writer.publish(db, "material", "after-prune")
+        await db.commit()
+        await reader.poll(db)
+    await engine.dispose()
+    return seen
+
+def test_events_are_seen_after_the_table_is_pruned(tmp_path):
+    assert asyncio.run(_events_after_prune(tmp_path)) == ["0", "1", "2", "3", "4", "after-prune"]
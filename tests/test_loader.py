@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from db.loader import DataLoader
+
+def run(coro):
+    return asyncio.run(coro)
+
+class RecordingBatch:
+    def __init__(self, results=None):
+        self.calls = []
+        self.results = results
+
+    async def __call__(self, keys):
+        self.calls.append(sorted(keys))
+        if self.results is not None:
+            return {k: self.results[k] for k in keys if k in self.results}
+        return {k: k * 10 for k in keys}
+
+def test_loads_in_one_tick_are_coalesced():
+    async def scenario():
+        batch = RecordingBatch()
+        loader = DataLoader(batch, asyncio.Lock())
+        first, second = await asyncio.gather(loader.load_many([1, 2]), loader.load(3))
+        return batch.calls, first, second
+
+    calls, first, second = run(scenario())
+    assert calls == [[1, 2, 3]]
+    assert first == [10, 20]
+    assert second == 30
+
+def test_repeated_keys_are_memoised():
+    async def scenario():
+        batch = RecordingBatch()
+        loader = DataLoader(batch, asyncio.Lock())
+        await loader.load_many([1, 1, 2])
+        await loader.load(2)
+        return batch.calls
+
+    assert run(scenario()) == [[1, 2]]
+
+def test_missing_keys_get_a_fresh_default():
+    async def scenario():
+        loader = DataLoader(RecordingBatch(results={}), asyncio.Lock(), default_factory=list)
+        return await loader.load_many([1, 2])
+
+    first, second = run(scenario())
+    assert first == [] and second == []
+    assert first is not second
+
+def test_batch_errors_reach_every_caller_and_are_not_cached():
+    async def scenario():
+        calls = []
+
+        async def failing(keys):
+            calls.append(keys)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return {k: k for k in keys}
+
+        loader = DataLoader(failing, asyncio.Lock())
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+        retried = await loader.load(1)
+        return results, retried
+
+    results, retried = run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert retried == 1
+
+def test_cancelled_batch_does_not_leave_callers_hanging():
+    async def scenario():
+        async def never(keys):
+            await asyncio.Event().wait()
+
+        loader = DataLoader(never, asyncio.Lock())
+        future = loader.load(1)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        for task in list(loader._tasks):
+            task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(future, timeout=1)
+
+    run(scenario())